@@ -11,11 +11,54 @@ It orchestrates the entire analysis pipeline:
 Think of this as the "conductor" that coordinates all the pieces.
 """
 
+import asyncio
+import logging
+import re
 from typing import Any, Dict
 
-from worker.integrations.github_client import get_github_client
+from worker.integrations.github_client import PRData, get_github_client
 from worker.integrations.huggingface_client import get_hf_client
 
+logger = logging.getLogger(__name__)
+
+# Sensitive filename fragments compiled into a single alternation, so each
+# filename is scanned once in C instead of once per pattern in Python
+_SENSITIVE_RE = re.compile(
+    r"config|secret|password|key|token|\.env", re.IGNORECASE
+)
+
+# Suffix sets for classifying changed files (frozenset membership is a
+# single O(1) C-level lookup, vs. a chain of endswith() calls)
+_SRC_SUFFIXES = frozenset({".py", ".js", ".ts", ".java", ".go"})
+_DOC_SUFFIXES = frozenset({".md", ".rst", ".txt"})
+
+# Static comment footer - no dynamic fields, so build it exactly once
+_COMMENT_FOOTER = """
+---
+<sub>🤖 Generated by [PR Pilot](https://github.com/sahilKumar1122/PR-Pilot) • Powered by AI</sub>
+"""
+
+
+def _classify_files(files, _src=_SRC_SUFFIXES, _doc=_DOC_SUFFIXES):
+    """
+    One pass over the changed files -> (has_tests, has_source, has_docs)
+
+    Module-level (not a method) and with the suffix sets bound as locals,
+    so the hot loop does no attribute or global lookups per file.
+    """
+    has_tests = has_source = has_docs = False
+    for f in files:
+        lf = f.lower()
+        suffix = "." + lf.rpartition(".")[2]
+        is_test = "test" in lf or "spec" in lf
+        if is_test:
+            has_tests = True
+        elif suffix in _src:
+            has_source = True
+        if suffix in _doc or "doc" in lf:
+            has_docs = True
+    return has_tests, has_source, has_docs
+
 
 class PRAnalyzer:
     """
@@ -32,17 +75,30 @@ class PRAnalyzer:
         self.hf = get_hf_client()
 
     def analyze(self, repo_name: str, pr_number: int) -> Dict[str, Any]:
+        """
+        Synchronous entry point for the analysis pipeline
+
+        Celery tasks and scripts call this; it just drives the async
+        pipeline to completion on a private event loop.
+        """
+        return asyncio.run(self.analyze_async(repo_name, pr_number))
+
+    async def analyze_async(self, repo_name: str, pr_number: int) -> Dict[str, Any]:
         """
         Complete PR analysis pipeline
 
         Steps:
         1. Fetch PR details and diff from GitHub
-        2. Summarize changes using AI
-        3. Classify PR intent
-        4. Generate commit message
+        2. Summarize changes using AI     } run concurrently -
+        3. Classify PR intent             } they're independent
+        4. Generate commit message (needs the summary)
         5. Detect potential issues
         6. Suggest tests/docs if needed
 
+        The pipeline is latency-bound on HTTP round-trips, not CPU, so
+        the independent AI calls are overlapped with asyncio.gather:
+        wall time drops from t_summary + t_classify to max of the two.
+
         Args:
             repo_name: Repository (e.g., "octocat/Hello-World")
             pr_number: PR number
@@ -50,71 +106,69 @@ class PRAnalyzer:
         Returns:
             Analysis results dict
         """
-        print(f"\n{'='*60}")
-        print(f"🔍 Analyzing {repo_name}#{pr_number}")
-        print(f"{'='*60}\n")
+        logger.info("🔍 Analyzing %s#%s", repo_name, pr_number)
 
-        # Step 1: Fetch PR data
-        print("📥 Step 1: Fetching PR details from GitHub...")
-        pr_data = self.github.get_pr_details(repo_name, pr_number)
+        # Step 1: Fetch PR data (blocking HTTP, so run it in a thread)
+        logger.info("📥 Step 1: Fetching PR details from GitHub...")
+        pr_data = await asyncio.to_thread(
+            self.github.get_pr_details, repo_name, pr_number
+        )
 
-        if "error" in pr_data:
+        if not isinstance(pr_data, PRData):
             return {"success": False, "error": pr_data["error"]}
 
-        print(f"   ✅ Found PR: {pr_data['title']}")
-        print(f"   📝 Author: {pr_data['author']}")
-        print(f"   📊 Changes: +{pr_data['additions']} -{pr_data['deletions']} lines")
-        print(f"   📁 Files: {len(pr_data['files_changed'])} changed\n")
+        logger.info(
+            "✅ Found PR: %s by %s (+%s -%s lines, %s files)",
+            pr_data.title,
+            pr_data.author,
+            pr_data.additions,
+            pr_data.deletions,
+            len(pr_data.files_changed),
+        )
 
-        # Step 2: Generate summary
-        print("🤖 Step 2: AI Summarization...")
+        # Steps 2+3: Summarization and classification are independent,
+        # so fire both inference calls and await them together
+        logger.info("🤖 Step 2+3: AI Summarization & Classification (concurrent)...")
         summary_text = self._create_summary_input(pr_data)
-        summary = self.hf.summarize(summary_text)
-        print(f"   ✅ Summary: {summary}\n")
-
-        # Step 3: Classify PR type
-        print("🏷️  Step 3: PR Classification...")
-        classification_text = f"{pr_data['title']}. {pr_data['body'][:200]}"
+        classification_text = f"{pr_data.title}. {pr_data.body[:200]}"
         labels = ["bug", "feature", "refactor", "docs"]
-        classification = self.hf.classify(classification_text, labels)
+
+        summary, classification = await asyncio.gather(
+            self.hf.summarize_async(summary_text),
+            self.hf.classify_async(classification_text, labels),
+        )
+        logger.info("✅ Summary: %s", summary)
 
         # Get the top classification
         pr_type = max(classification, key=classification.get)
         confidence = classification[pr_type]
-        print(f"   ✅ Type: {pr_type} (confidence: {confidence:.0%})\n")
+        logger.info("✅ Type: %s (confidence: %.0f%%)", pr_type, confidence * 100)
 
         # Step 4: Generate commit message
-        print("💬 Step 4: Generating commit message...")
-        commit_msg = self.hf.generate_commit_message(pr_data["title"], summary, pr_type)
-        print(f"   ✅ Suggested: {commit_msg}\n")
+        logger.info("💬 Step 4: Generating commit message...")
+        commit_msg = self.hf.generate_commit_message(pr_data.title, summary, pr_type)
+        logger.info("✅ Suggested: %s", commit_msg)
 
         # Step 5: Detect potential issues
-        print("⚠️  Step 5: Detecting potential issues...")
+        logger.info("⚠️  Step 5: Detecting potential issues...")
         risks = self._detect_risks(pr_data)
-        if risks:
-            for risk in risks:
-                print(f"   - {risk}")
-        else:
-            print("   ✅ No major risks detected")
-        print()
+        logger.info("Risks: %s", risks or "none detected")
 
         # Step 6: Check for missing tests/docs
-        print("🧪 Step 6: Checking tests & documentation...")
+        logger.info("🧪 Step 6: Checking tests & documentation...")
         suggestions = self._generate_suggestions(pr_data)
-        for suggestion in suggestions:
-            print(f"   - {suggestion}")
-        print()
+        logger.info("Suggestions: %s", suggestions)
 
         # Compile results
         result = {
             "success": True,
             "pr_data": {
-                "title": pr_data["title"],
-                "author": pr_data["author"],
-                "url": pr_data["url"],
-                "additions": pr_data["additions"],
-                "deletions": pr_data["deletions"],
-                "files_changed": pr_data["files_changed"],
+                "title": pr_data.title,
+                "author": pr_data.author,
+                "url": pr_data.url,
+                "additions": pr_data.additions,
+                "deletions": pr_data.deletions,
+                "files_changed": pr_data.files_changed,
             },
             "analysis": {
                 "summary": summary,
@@ -129,32 +183,30 @@ class PRAnalyzer:
             },
         }
 
-        print(f"{'='*60}")
-        print("✅ Analysis complete!")
-        print(f"{'='*60}\n")
+        logger.info("✅ Analysis complete for %s#%s", repo_name, pr_number)
 
         return result
 
-    def _create_summary_input(self, pr_data: Dict) -> str:
+    def _create_summary_input(self, pr_data: PRData) -> str:
         """
         Create input text for summarization
 
         Combines title, description, and a preview of changes
         """
-        text = f"Title: {pr_data['title']}\n\n"
+        text = f"Title: {pr_data.title}\n\n"
 
-        if pr_data["body"]:
-            text += f"Description: {pr_data['body'][:300]}\n\n"
+        if pr_data.body:
+            text += f"Description: {pr_data.body[:300]}\n\n"
 
-        text += f"Changed files: {', '.join(pr_data['files_changed'][:5])}\n\n"
+        text += f"Changed files: {', '.join(pr_data.files_changed[:5])}\n\n"
 
         # Add a preview of the diff (first 500 chars)
-        if pr_data["diff"]:
-            text += f"Changes preview:\n{pr_data['diff'][:500]}"
+        if pr_data.diff:
+            text += f"Changes preview:\n{pr_data.diff[:500]}"
 
         return text
 
-    def _detect_risks(self, pr_data: Dict) -> list:
+    def _detect_risks(self, pr_data: PRData) -> list:
         """
         Detect potential risks based on heuristics
 
@@ -163,26 +215,25 @@ class PRAnalyzer:
         risks = []
 
         # Large PRs are risky
-        total_changes = pr_data["additions"] + pr_data["deletions"]
+        total_changes = pr_data.additions + pr_data.deletions
         if total_changes > 500:
             risks.append(
                 "⚠️  Large PR (500+ lines): Consider splitting into smaller PRs"
             )
 
         # Many files changed
-        if len(pr_data["files_changed"]) > 10:
+        if len(pr_data.files_changed) > 10:
             risks.append("⚠️  Many files changed: Review carefully for side effects")
 
-        # Check for sensitive files
-        sensitive_patterns = ["config", "secret", "password", "key", "token", ".env"]
-        for file in pr_data["files_changed"]:
-            if any(pattern in file.lower() for pattern in sensitive_patterns):
+        # Check for sensitive files - one compiled multi-pattern scan per
+        # file, and IGNORECASE means no per-file .lower() copy either
+        for file in pr_data.files_changed:
+            if _SENSITIVE_RE.search(file):
                 risks.append(f"🔒 Sensitive file modified: {file}")
-                break
 
         return risks
 
-    def _generate_suggestions(self, pr_data: Dict) -> list:
+    def _generate_suggestions(self, pr_data: PRData) -> list:
         """
         Generate improvement suggestions
 
@@ -190,27 +241,15 @@ class PRAnalyzer:
         """
         suggestions = []
 
-        # Check for test files
-        has_tests = any(
-            "test" in f.lower() or "spec" in f.lower() for f in pr_data["files_changed"]
-        )
-
-        has_source_code = any(
-            f.endswith((".py", ".js", ".ts", ".java", ".go"))
-            and "test" not in f.lower()
-            for f in pr_data["files_changed"]
+        # Single fused pass over the file list (see _classify_files)
+        has_tests, has_source_code, has_docs = _classify_files(
+            pr_data.files_changed
         )
 
         if has_source_code and not has_tests:
             suggestions.append("🧪 Consider adding tests for the new code")
 
-        # Check for documentation
-        has_docs = any(
-            f.endswith((".md", ".rst", ".txt")) or "doc" in f.lower()
-            for f in pr_data["files_changed"]
-        )
-
-        if not has_docs and len(pr_data["files_changed"]) > 3:
+        if not has_docs and len(pr_data.files_changed) > 3:
             suggestions.append("📚 Consider updating documentation")
 
         if not suggestions:
@@ -231,7 +270,11 @@ class PRAnalyzer:
         ai = analysis["analysis"]
         suggestions = analysis["suggestions"]
 
-        comment = f"""## 🤖 PR Pilot Analysis
+        # Collect pieces in a list and join once at the end: each
+        # str += allocates a whole new string, so repeated concatenation
+        # is O(n^2) in the comment size, while join is a single pass
+        parts = [
+            f"""## 🤖 PR Pilot Analysis
 
 **Summary:** {ai['summary']}
 
@@ -247,20 +290,16 @@ class PRAnalyzer:
 
 ### ⚠️  Potential Risks
 """
+        ]
 
         if suggestions["risks"]:
-            for risk in suggestions["risks"]:
-                comment += f"- {risk}\n"
+            parts.extend(f"- {risk}\n" for risk in suggestions["risks"])
         else:
-            comment += "- ✅ No major risks detected\n"
+            parts.append("- ✅ No major risks detected\n")
 
-        comment += "\n### 💡 Suggestions\n"
-        for suggestion in suggestions["improvements"]:
-            comment += f"- {suggestion}\n"
+        parts.append("\n### 💡 Suggestions\n")
+        parts.extend(f"- {suggestion}\n" for suggestion in suggestions["improvements"])
 
-        comment += """
----
-<sub>🤖 Generated by [PR Pilot](https://github.com/sahilKumar1122/PR-Pilot) • Powered by AI</sub>
-"""
+        parts.append(_COMMENT_FOOTER)
 
-        return comment
+        return "".join(parts)
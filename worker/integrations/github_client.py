@@ -10,10 +10,47 @@ We use PyGithub library which provides a clean Python interface
 to the GitHub REST API.
 """
 
+import logging
 import os
-from typing import Any, Dict, Optional
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
 
-from github import Github, GithubException
+import httpx
+from github import Github
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class PRData:
+    """
+    Everything the analyzer needs to know about a pull request
+
+    A slots dataclass instead of a plain dict: the analyzer reads these
+    fields 20+ times per PR, and slot access is a fixed C-level offset
+    load versus a hash+probe per dict lookup. Frozen + tuples keep it
+    immutable, and slots roughly halve the per-instance memory.
+    """
+
+    title: str
+    body: str
+    author: str
+    diff: str
+    files_changed: Tuple[str, ...]
+    additions: int
+    deletions: int
+    state: str
+    labels: Tuple[str, ...]
+    url: str
+    base_branch: str
+    head_branch: str
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Filenames straight from the unified diff headers, so we don't need a
+# second paginated API call just to list the changed files
+_DIFF_FILE_RE = re.compile(r"diff --git a/.+? b/(.+)$")
 
 
 class GitHubClient:
@@ -35,67 +72,124 @@ class GitHubClient:
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
-            print("⚠️  WARNING: GITHUB_TOKEN not set. API calls will fail.")
-
-        self.github = Github(self.token)
-
-    def get_pr_details(self, repo_name: str, pr_number: int) -> Dict[str, Any]:
+            logger.warning("⚠️  GITHUB_TOKEN not set. API calls will fail.")
+
+        # per_page=100 cuts pagination round-trips; pool_size keeps TLS
+        # connections warm across calls instead of re-handshaking
+        self.github = Github(self.token, per_page=100, pool_size=20)
+
+        # Persistent HTTP/2 client for the hot path: one TCP+TLS connection
+        # multiplexes the details + diff requests and stays warm across PRs
+        self._http = httpx.Client(
+            http2=True,
+            base_url=GITHUB_API_URL,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github+json",
+            },
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            timeout=30.0,
+        )
+
+    def get_pr_details(
+        self,
+        repo_name: str,
+        pr_number: int,
+        diff_preview_bytes: int = 2048,
+        body_preview_chars: int = 1024,
+    ) -> Union[PRData, Dict[str, Any]]:
         """
         Fetch comprehensive PR details
 
+        The analyzer only ever reads the first few hundred characters of
+        the diff and description, so we don't materialize megabytes of
+        patch text: the diff is streamed line by line, filenames are
+        collected from the headers as they pass, and only the first
+        `diff_preview_bytes` of text is kept. Use get_full_diff() if a
+        future caller really needs the whole patch.
+
         Args:
             repo_name: Full repository name (e.g., "octocat/Hello-World")
             pr_number: Pull request number
+            diff_preview_bytes: How much diff text to keep
+            body_preview_chars: How much of the PR description to keep
 
         Returns:
-            Dict containing:
+            PRData on success (a dict with an "error" key on failure):
                 - title, body, author
-                - diff (the actual code changes!)
-                - files_changed (list of modified files)
+                - diff (preview of the actual code changes)
+                - files_changed (tuple of modified files)
                 - additions, deletions (line counts)
-                - labels, reviewers, etc.
+                - labels, branches, etc.
 
         Example:
             data = client.get_pr_details("myorg/myrepo", 42)
-            print(data['diff'])  # See the actual code changes
+            print(data.diff)  # See the actual code changes
         """
         try:
-            repo = self.github.get_repo(repo_name)
-            pr = repo.get_pull(pr_number)
-
-            # Get the diff (patch format)
-            # This shows what actually changed in the code
-            diff = pr.get_files()
-            diff_text = ""
-
-            for file in diff:
-                if file.patch:  # Some files don't have patches (binary, etc.)
-                    diff_text += f"\n--- {file.filename} ---\n"
-                    diff_text += file.patch
-                    diff_text += "\n"
-
-            return {
-                "title": pr.title,
-                "body": pr.body or "",
-                "author": pr.user.login,
-                "diff": diff_text,
-                "files_changed": [f.filename for f in diff],
-                "additions": pr.additions,
-                "deletions": pr.deletions,
-                "state": pr.state,
-                "labels": [label.name for label in pr.labels],
-                "url": pr.html_url,
-                "base_branch": pr.base.ref,
-                "head_branch": pr.head.ref,
-            }
+            pr_url = f"/repos/{repo_name}/pulls/{pr_number}"
+
+            # Two direct GETs over the shared HTTP/2 connection: the PR
+            # details as JSON, and the unified diff via the diff media
+            # type (no get_files() pagination, no PyGithub reflection)
+            response = self._http.get(pr_url)
+            response.raise_for_status()
+            pr = response.json()
+
+            # Stream the diff: grab filenames from every header line but
+            # keep only the preview's worth of text in memory
+            files_changed = []
+            preview_parts: list = []
+            preview_len = 0
+            with self._http.stream(
+                "GET", pr_url, headers={"Accept": "application/vnd.github.v3.diff"}
+            ) as diff_response:
+                diff_response.raise_for_status()
+                for line in diff_response.iter_lines():
+                    match = _DIFF_FILE_RE.match(line)
+                    if match:
+                        files_changed.append(match.group(1))
+                    if preview_len < diff_preview_bytes:
+                        preview_parts.append(line)
+                        preview_len += len(line) + 1
+            diff_text = "\n".join(preview_parts)
+
+            return PRData(
+                title=pr["title"],
+                body=(pr["body"] or "")[:body_preview_chars],
+                author=pr["user"]["login"],
+                diff=diff_text,
+                files_changed=tuple(files_changed),
+                additions=pr["additions"],
+                deletions=pr["deletions"],
+                state=pr["state"],
+                labels=tuple(label["name"] for label in pr["labels"]),
+                url=pr["html_url"],
+                base_branch=pr["base"]["ref"],
+                head_branch=pr["head"]["ref"],
+            )
 
-        except GithubException as e:
-            print(f"❌ Failed to fetch PR details: {e}")
+        except httpx.HTTPError as e:
+            logger.error("❌ Failed to fetch PR details: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
             return {"error": str(e)}
 
+    def get_full_diff(self, repo_name: str, pr_number: int) -> str:
+        """
+        Fetch the complete unified diff for a PR
+
+        get_pr_details() deliberately keeps only a small preview; call
+        this lazily if an analysis actually needs the whole patch.
+        """
+        response = self._http.get(
+            f"/repos/{repo_name}/pulls/{pr_number}",
+            headers={"Accept": "application/vnd.github.v3.diff"},
+        )
+        response.raise_for_status()
+        return response.text
+
     def post_comment(self, repo_name: str, pr_number: int, comment: str) -> bool:
         """
         Post a comment to a PR
@@ -118,18 +212,23 @@ class GitHubClient:
             )
         """
         try:
-            repo = self.github.get_repo(repo_name)
-            pr = repo.get_pull(pr_number)
-            pr.create_issue_comment(comment)
+            # One direct POST over the shared HTTP/2 connection - no
+            # Repository/PullRequest object round-trips, and concurrent
+            # posts from busy workers multiplex on the same socket
+            response = self._http.post(
+                f"/repos/{repo_name}/issues/{pr_number}/comments",
+                json={"body": comment},
+            )
+            response.raise_for_status()
 
-            print(f"✅ Posted comment to {repo_name}#{pr_number}")
+            logger.info("✅ Posted comment to %s#%s", repo_name, pr_number)
             return True
 
-        except GithubException as e:
-            print(f"❌ Failed to post comment: {e}")
+        except httpx.HTTPError as e:
+            logger.error("❌ Failed to post comment: %s", e)
             return False
         except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
             return False
 
     def get_rate_limit(self) -> Dict[str, int]:
@@ -151,7 +250,7 @@ class GitHubClient:
                 "reset_time": rate_limit.core.reset.isoformat(),
             }
         except Exception as e:
-            print(f"❌ Failed to get rate limit: {e}")
+            logger.error("❌ Failed to get rate limit: %s", e)
             return {"remaining": 0, "limit": 0, "reset_time": "unknown"}
 
 
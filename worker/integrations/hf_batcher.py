@@ -0,0 +1,111 @@
+"""
+HuggingFace Micro-Batcher
+
+The Inference API accepts {"inputs": [t1, t2, ...]} and runs the whole
+list in one forward pass, so K concurrent single-text calls can be
+collapsed into ceil(K/B) batched requests - one network round-trip and
+one GPU pass each instead of K.
+
+How it works:
+1. Each caller awaits submit(text), which parks a (text, future) pair
+2. The first submitter in a window starts a drain task
+3. The drain task waits `max_wait` for concurrent callers to pile up,
+   then sends up to `max_batch` items as ONE request per length bucket
+4. Each caller's future resolves with its aligned slice of the output
+
+Inputs are grouped into rough length buckets before batching: padding a
+tweet-sized title out to a 4 KB diff wastes most of the GPU work, so
+only similarly-sized texts share a request.
+"""
+
+import asyncio
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Upper bounds (in characters) of the co-batching buckets; anything
+# bigger than the last bound lands in a final catch-all bucket
+_BUCKET_BOUNDS = (128, 512)
+
+
+def _bucket(text: str) -> int:
+    """Map a text to its length-bucket index"""
+    for i, bound in enumerate(_BUCKET_BOUNDS):
+        if len(text) < bound:
+            return i
+    return len(_BUCKET_BOUNDS)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent inference calls into batched API requests
+
+    Usage:
+        batcher = MicroBatcher(send_batch=client.summarize_many)
+        summary = await batcher.submit("long PR diff ...")
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[str]], List],
+        max_batch: int = 16,
+        max_wait: float = 0.1,
+    ):
+        self._send_batch = send_batch  # blocking: List[str] -> List[result]
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        # bucket index -> list of (text, future) waiting to be sent
+        self._pending: Dict[int, List[Tuple[str, asyncio.Future]]] = {}
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def submit(self, item: str):
+        """Queue one input and wait for its slice of the batched result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(_bucket(item), []).append((item, future))
+
+        # First submitter in a window kicks off the drain task
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain())
+
+        return await future
+
+    async def _drain(self):
+        # Let concurrent callers pile up for one short window
+        await asyncio.sleep(self._max_wait)
+
+        while any(self._pending.values()):
+            for bucket_index in list(self._pending):
+                queue = self._pending[bucket_index]
+                if not queue:
+                    del self._pending[bucket_index]
+                    continue
+
+                batch = queue[: self._max_batch]
+                del queue[: len(batch)]
+
+                try:
+                    results = await asyncio.to_thread(
+                        self._send_batch, [item for item, _ in batch]
+                    )
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                # A short (or long) result list would make zip silently
+                # drop callers, leaving their futures - and the Celery
+                # slots awaiting them - hung forever. Fail the whole
+                # batch loudly instead.
+                if len(results) != len(batch):
+                    error = RuntimeError(
+                        f"batch of {len(batch)} inputs got "
+                        f"{len(results)} results"
+                    )
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
@@ -14,10 +14,280 @@ Why HuggingFace?
 - Great for learning AI integration
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import logging
 import os
-from typing import Dict, List, Optional
+import re
+import threading
+import time
+import types
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
-from huggingface_hub import InferenceClient
+import orjson
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter, Retry
+
+from worker.integrations.hf_batcher import MicroBatcher
+
+logger = logging.getLogger("pr_pilot.hf")
+
+# Connection-pool sizing for the shared inference session. All requests
+# hit the same api-inference.huggingface.co host, so one pool of warm
+# keep-alive connections (TLS handshake is ~100-300 ms each) is shared
+# by every task in the process.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+_POOL_RETRIES = Retry(total=3, backoff_factor=0.3)
+
+
+def _build_session() -> requests.Session:
+    """
+    Session factory handed to huggingface_hub for all its HTTP calls
+
+    SSL verification stays ON unless HF_VERIFY_SSL=0 is set (for
+    corporate networks with TLS inspection - development only!), and the
+    adapter keeps a real connection pool with retries so repeated
+    inference calls reuse warm TLS sessions.
+    """
+    session = requests.Session()
+    session.verify = os.getenv("HF_VERIFY_SSL", "1") == "1"
+    if not session.verify:
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=_POOL_RETRIES,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def _hf_inference_clients():
+    """
+    Import huggingface_hub and register the pooled backend, exactly once
+
+    huggingface_hub drags in a few hundred ms of transitive imports
+    (tqdm, packaging, filelock...), so deferring it here keeps `import
+    worker.tasks` fast - Celery's worker_process_init warms this before
+    the first task. The backend factory is registered right before the
+    classes escape, preserving the 'pooled before any client exists'
+    invariant. lru_cache may run this twice if threads race the first
+    call, but that's harmless here: the import is process-wide anyway
+    and re-registering the same factory is idempotent.
+    """
+    from huggingface_hub import (
+        AsyncInferenceClient,
+        InferenceClient,
+        configure_http_backend,
+    )
+
+    configure_http_backend(backend_factory=_build_session)
+    return InferenceClient, AsyncInferenceClient
+
+# How long cached inference results live - in Redis and in the
+# in-process tier alike (the models are deterministic for identical
+# input, so a day is safe)
+_CACHE_TTL_SECONDS = 86400
+
+# Upper bound on the in-process tier: entries are small (a summary
+# string or a four-label score dict), so 1024 of them is a few hundred
+# KB, and least-recently-used ones are evicted first
+_LOCAL_CACHE_MAXSIZE = 1024
+
+
+def _cache_key(task: str, text: str, labels: Optional[List[str]] = None) -> bytes:
+    """Compact 16-byte blake2b key over (task, text, labels)"""
+    payload = task + "|" + text + "|" + ",".join(labels or ())
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+# Summarization models, in preference order (lighter one first)
+_SUMMARY_MODELS = (
+    "sshleifer/distilbart-cnn-12-6",  # Lighter, faster model
+    "facebook/bart-large-cnn",  # Original model
+)
+
+# The model the micro-batcher posts its batched requests to
+_BATCH_MODEL = _SUMMARY_MODELS[0]
+
+# The bart/distilbart summarizers take 1024 *tokens* of input. The old
+# code truncated at 512 *characters* - roughly an eighth of what fits -
+# wasting most of the model's context on every call.
+_SUMMARY_TOKEN_BUDGET = 1024
+_CHARS_PER_TOKEN = 4  # heuristic used when no local tokenizer is installed
+
+
+@functools.lru_cache(maxsize=2)
+def _tok(name: str):
+    """
+    Cached fast tokenizer for local truncation, or None if transformers
+    isn't installed (it's optional - the char heuristic covers that case)
+    """
+    try:
+        from transformers import AutoTokenizer
+
+        return AutoTokenizer.from_pretrained(name)
+    except Exception:
+        return None
+
+
+def _trim_to_budget(text: str, model: str = _SUMMARY_MODELS[0]) -> str:
+    """
+    Trim text to the summarizer's real input budget
+
+    With a local fast tokenizer this truncates at exactly
+    _SUMMARY_TOKEN_BUDGET tokens (the Rust backend releases the GIL, so
+    encoding is cheap); otherwise it approximates with ~4 chars/token.
+    """
+    tokenizer = _tok(model)
+    if tokenizer is not None:
+        ids = tokenizer.encode(
+            text, truncation=True, max_length=_SUMMARY_TOKEN_BUDGET
+        )
+        return tokenizer.decode(ids, skip_special_tokens=True)
+
+    limit = _SUMMARY_TOKEN_BUDGET * _CHARS_PER_TOKEN
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# Unified-diff plumbing lines: pure syntax, zero semantic content
+_DIFF_NOISE_PREFIXES = ("diff --git", "index ", "--- ", "+++ ", "@@")
+
+
+def _extract_diff_signal(text: str) -> str:
+    """
+    Spend the token budget on content, not diff plumbing
+
+    The first 512 chars of a unified diff are mostly `diff --git`,
+    `index`, `---`/`+++` and `@@` headers, so a naive prefix slice fed
+    the model almost no signal. This keeps prose (title/description)
+    untouched, drops the header lines, keeps only the +/- change lines
+    inside diff sections, and dedups repeated lines - the trimmed result
+    then goes through the usual token-budget truncation.
+    """
+    in_diff = False
+    kept = []
+    for line in text.splitlines():
+        if line.startswith(_DIFF_NOISE_PREFIXES):
+            in_diff = True
+            continue
+        if in_diff and not line.startswith(("+", "-")):
+            continue  # context line inside a hunk
+        kept.append(line)
+    # dict.fromkeys dedups while keeping first-seen order
+    return "\n".join(dict.fromkeys(kept))
+
+
+def _split_for_summary(text: str) -> List[str]:
+    """
+    Split an over-budget text into budget-sized chunks on line breaks
+
+    Used for map-reduce summarization: each chunk is summarized (the
+    chunks batch into one API call), then the concatenated summaries are
+    summarized again.
+    """
+    limit = _SUMMARY_TOKEN_BUDGET * _CHARS_PER_TOKEN
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for line in text.splitlines(keepends=True):
+        if current_len + len(line) > limit and current:
+            chunks.append("".join(current))
+            current, current_len = [], 0
+        current.append(line)
+        current_len += len(line)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+# Keyword lists for the offline classification fallback, compiled once
+# into one alternation regex per label: findall scans the text a single
+# time in C, instead of one Python `in` search per keyword. The mapping
+# proxy makes the constant read-only - built once, never mutated.
+_FALLBACK_KEYWORDS = types.MappingProxyType({
+    "bug": ["fix", "bug", "issue", "error", "crash", "broken"],
+    "feature": ["add", "new", "feature", "implement", "create"],
+    "refactor": ["refactor", "cleanup", "improve", "optimize", "reorganize"],
+    "docs": ["doc", "readme", "comment", "documentation"],
+})
+
+# Classification label -> Conventional Commits type, hoisted out of
+# generate_commit_message so the dict isn't rebuilt on every call
+_TYPE_MAPPING = types.MappingProxyType({
+    "bug": "fix",
+    "feature": "feat",
+    "refactor": "refactor",
+    "docs": "docs",
+})
+_KW_RES = {
+    label: re.compile(r"\b(" + "|".join(map(re.escape, kws)) + r")", re.IGNORECASE)
+    for label, kws in _FALLBACK_KEYWORDS.items()
+}
+
+
+def _parse_summary(result) -> str:
+    """
+    Normalize a summarization response to plain text
+
+    The response shape varies across huggingface_hub versions (str,
+    object, dict, list-of-dicts), so both the sync and async paths
+    funnel through this one helper.
+    """
+    if isinstance(result, str):
+        return result
+    # Fast path: assume the shape the pinned huggingface_hub actually
+    # returns and let the rare mismatch pay the exception cost, instead
+    # of walking an isinstance ladder on every response
+    try:
+        if isinstance(result, list):
+            result = result[0]
+        try:
+            return result.summary_text
+        except AttributeError:
+            return result["summary_text"]
+    except (AttributeError, KeyError, IndexError, TypeError):
+        return str(result)
+
+
+def _pairs(result):
+    """
+    Pull (labels, scores) off any known response shape, or (None, None)
+
+    Same fast-path style as _parse_summary: one attempt at the real
+    shape (attribute access, then key access, unwrapping a one-element
+    list first), exceptions for the rest.
+    """
+    try:
+        if isinstance(result, list):
+            result = result[0]
+        try:
+            return result.labels, result.scores
+        except AttributeError:
+            return result["labels"], result["scores"]
+    except (AttributeError, KeyError, IndexError, TypeError):
+        return None, None
+
+
+def _parse_classification(result) -> Optional[Dict[str, float]]:
+    """
+    Normalize a zero-shot classification response to {label: score}
+
+    Returns None when the shape isn't recognized, so callers can fall
+    back to keyword classification. dict(zip(...)) builds the mapping in
+    one C call instead of a comprehension's bytecode loop.
+    """
+    labels, scores = _pairs(result)
+    if labels is None:
+        return None
+    return dict(zip(labels, scores))
 
 
 class HuggingFaceClient:
@@ -39,27 +309,108 @@ class HuggingFaceClient:
         """
         self.api_key = api_key or os.getenv("HF_API_KEY")
         if not self.api_key:
-            print("⚠️  WARNING: HF_API_KEY not set. API calls will fail.")
-
-        # For corporate networks with SSL inspection
-        # This disables SSL verification (use only in development!)
-
-        import urllib3
-
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-        self.client = InferenceClient(token=self.api_key)
-
-        # Monkey patch to disable SSL verification
-        import requests
+            logger.warning("⚠️  HF_API_KEY not set. API calls will fail.")
+
+        # Lazily imported (see _hf_inference_clients): the pooled-session
+        # factory is registered before the classes are handed out, so
+        # every huggingface_hub call in the process shares warm connections
+        InferenceClient, AsyncInferenceClient = _hf_inference_clients()
+        self.client = InferenceClient(token=self.api_key, timeout=30)
+
+        # Async twin of the client above: awaiting it overlaps inference
+        # round-trips on the event loop with no thread-pool hop
+        self.aclient = AsyncInferenceClient(token=self.api_key, timeout=30)
+
+        # Batches concurrent summarize_async() calls into one API request
+        self._summary_batcher = MicroBatcher(
+            self._summarize_batch, max_batch=16, max_wait=0.1
+        )
+
+        # model -> monotonic deadline until which it's known to be
+        # cold-loading (last 503 said so); calls skip it until then
+        self._cold_until: Dict[str, float] = {}
+
+        # Response cache: re-runs and force-pushes often re-analyze the
+        # exact same text, and each miss costs 1-20s of inference. First
+        # tier is a bounded in-process LRU whose entries expire on the
+        # same TTL as Redis; second is Redis itself (shared across
+        # workers), reusing the queue's REDIS_URL if it's configured.
+        self._cache: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis
 
-        original_request = requests.Session.request
+                self._redis = redis.Redis.from_url(redis_url)
+            except Exception as e:
+                logger.warning("⚠️  HF cache: Redis unavailable (%s)", str(e)[:60])
+
+    def _local_put(self, key: bytes, value) -> None:
+        """Insert into the in-process LRU, evicting the oldest past maxsize"""
+        self._cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > _LOCAL_CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+
+    def _cache_get(self, key: bytes):
+        """Look up a cached inference result (process tier, then Redis)"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self._cache.move_to_end(key)  # mark as recently used
+                return value
+            del self._cache[key]  # expired with the Redis tier - drop it
+
+        if self._redis is not None:
+            try:
+                blob = self._redis.get(b"pr_pilot:hf:" + key)
+            except Exception:
+                return None
+            if blob is not None:
+                try:
+                    # orjson, not pickle: values are plain str/dict, and
+                    # deserializing JSON can't execute anything even if
+                    # the Redis contents were tampered with
+                    value = orjson.loads(blob)
+                except orjson.JSONDecodeError:
+                    return None  # stale/foreign blob - treat as a miss
+                self._local_put(key, value)  # promote to the process tier
+                return value
+
+        return None
+
+    def _cache_put(self, key: bytes, value) -> None:
+        """Store a successful inference result in both cache tiers"""
+        self._local_put(key, value)
+        if self._redis is not None:
+            try:
+                self._redis.setex(
+                    b"pr_pilot:hf:" + key, _CACHE_TTL_SECONDS, orjson.dumps(value)
+                )
+            except Exception:
+                pass  # cache writes are best-effort
 
-        def patched_request(self, method, url, **kwargs):
-            kwargs["verify"] = False
-            return original_request(self, method, url, **kwargs)
+    def _note_cold(self, model: str, exc: BaseException) -> None:
+        """
+        Remember a 503 cold-start so later calls skip the model outright
 
-        requests.Session.request = patched_request
+        A cold model stays cold for its whole load (tens of seconds), so
+        re-contacting it on the next PR just re-eats the 503 round-trip.
+        The response body carries estimated_time; without one we assume
+        30 s. Anything that isn't a 503 is a real failure and doesn't
+        mark the model cold.
+        """
+        response = getattr(exc, "response", None)
+        if response is None or getattr(response, "status_code", None) != 503:
+            return
+        try:
+            wait = float(response.json().get("estimated_time", 30))
+        except Exception:
+            wait = 30.0
+        self._cold_until[model] = time.monotonic() + wait
+        logger.debug("Model %s cold-loading (~%.0fs), skipping until then", model, wait)
 
     def summarize(self, text: str, max_length: int = 150, min_length: int = 30) -> str:
         """
@@ -83,49 +434,156 @@ class HuggingFaceClient:
             ''')
             # Returns: "This PR adds authentication middleware and fixes login issues"
         """
-        # Try multiple times with different strategies
-        models_to_try = [
-            "sshleifer/distilbart-cnn-12-6",  # Lighter, faster model
-            "facebook/bart-large-cnn",  # Original model
-        ]
-
-        for model in models_to_try:
+        key = _cache_key("summarization", text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        # Strip diff plumbing, then trim to the model's actual token
+        # budget (both models share the bart tokenizer, so one trim
+        # covers the whole ladder)
+        text = _trim_to_budget(_extract_diff_signal(text))
+
+        now = time.monotonic()
+        for model in _SUMMARY_MODELS:
+            if now < self._cold_until.get(model, 0.0):
+                logger.debug("Skipping %s - still cold-loading", model)
+                continue
             try:
-                # Truncate if text is too long (model has limits)
-                if len(text) > 512:
-                    text = text[:512] + "..."
-
-                print(f"   Trying model: {model}...")
-
-                import time
-
-                start = time.time()
+                logger.debug("Trying model: %s...", model)
 
+                start = time.perf_counter()
                 result = self.client.summarization(text, model=model)
+                elapsed = time.perf_counter() - start
+                logger.debug("model=%s elapsed=%.1fs", model, elapsed)
 
-                elapsed = time.time() - start
-                print(f"   ✅ Success in {elapsed:.1f}s")
-
-                # Handle different response formats
-                if isinstance(result, str):
-                    return result
-                elif hasattr(result, "summary_text"):
-                    return result.summary_text
-                elif isinstance(result, dict) and "summary_text" in result:
-                    return result["summary_text"]
-                elif isinstance(result, list) and len(result) > 0:
-                    if isinstance(result[0], dict) and "summary_text" in result[0]:
-                        return result[0]["summary_text"]
-                    return str(result[0])
-                else:
-                    return str(result)
+                summary = _parse_summary(result)
+                self._cache_put(key, summary)
+                return summary
 
             except Exception as e:
-                print(f"   ⚠️  Model {model} failed: {str(e)[:100]}")
+                self._note_cold(model, e)
+                logger.warning("⚠️  Model %s failed: %s", model, str(e)[:100])
                 continue
 
         # If all models fail, create a simple summary
-        print("   ℹ️  Using fallback: Simple text extraction")
+        logger.info("ℹ️  Using fallback: Simple text extraction")
+        return self._fallback_summary(text)
+
+    def _summarize_batch(self, texts: List[str]) -> List[str]:
+        """
+        Summarize several texts with ONE API call
+
+        The Inference API accepts {"inputs": [t1, t2, ...]} and runs the
+        whole list in a single forward pass, amortizing the network and
+        model overhead across the batch. Called by the micro-batcher.
+        """
+        trimmed = [_trim_to_budget(_extract_diff_signal(t)) for t in texts]
+
+        try:
+            response = self.client.post(
+                json={"inputs": trimmed},
+                model=_BATCH_MODEL,
+                task="summarization",
+            )
+        except Exception as e:
+            # A 503 here means the batch model is cold-loading: remember
+            # it so the next analyses skip straight to the model race
+            # instead of re-eating the round-trip
+            self._note_cold(_BATCH_MODEL, e)
+            raise
+        results = json.loads(response)
+
+        return [
+            item["summary_text"] if isinstance(item, dict) else str(item)
+            for item in results
+        ]
+
+    async def summarize_async(
+        self, text: str, max_length: int = 150, min_length: int = 30
+    ) -> str:
+        """
+        Async version of summarize()
+
+        Default-parameter calls go through the micro-batcher, so bursts
+        of concurrent PR analyses share one batched API request. If the
+        batched call fails (or custom lengths are asked for), walk the
+        same model ladder as summarize(), but awaiting the
+        AsyncInferenceClient - the round-trip overlaps with other
+        coroutines on the loop instead of occupying a thread.
+        """
+        key = _cache_key("summarization", text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        # Drop diff plumbing up front so both the size check and the
+        # batched call see only meaningful lines
+        text = _extract_diff_signal(text)
+
+        # Batched fast path - unless the batch model is known to be
+        # cold-loading, in which case go straight to the model race
+        # rather than queueing up for a guaranteed 503
+        if (
+            max_length == 150
+            and min_length == 30
+            and time.monotonic() >= self._cold_until.get(_BATCH_MODEL, 0.0)
+        ):
+            try:
+                if len(text) > 2 * _SUMMARY_TOKEN_BUDGET * _CHARS_PER_TOKEN:
+                    # Map-reduce for big diffs: summarize budget-sized
+                    # chunks (they coalesce into one batched API call),
+                    # then summarize the concatenated summaries
+                    chunk_summaries = await asyncio.gather(
+                        *(
+                            self._summary_batcher.submit(chunk)
+                            for chunk in _split_for_summary(text)
+                        )
+                    )
+                    summary = await self._summary_batcher.submit(
+                        " ".join(chunk_summaries)
+                    )
+                else:
+                    summary = await self._summary_batcher.submit(text)
+                self._cache_put(key, summary)
+                return summary
+            except Exception as e:
+                logger.warning("⚠️  Batched summarization failed: %s", str(e)[:100])
+
+        text = _trim_to_budget(text)
+
+        # Race both models instead of trying them one after another: if
+        # the first is cold-loading (503 + up to 20s), the serial loop ate
+        # that whole penalty before even contacting the second. The first
+        # successful answer wins and the losers are cancelled. Models
+        # already known to be cold don't even enter the race.
+        now = time.monotonic()
+        task_models = {
+            asyncio.create_task(self.aclient.summarization(text, model=model)): model
+            for model in _SUMMARY_MODELS
+            if now >= self._cold_until.get(model, 0.0)
+        }
+        try:
+            pending = set(task_models)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        summary = _parse_summary(task.result())
+                        self._cache_put(key, summary)
+                        return summary
+                    self._note_cold(task_models[task], task.exception())
+                    logger.warning(
+                        "⚠️  Summarization task failed: %s",
+                        str(task.exception())[:100],
+                    )
+        finally:
+            for task in task_models:
+                task.cancel()
+
+        logger.info("ℹ️  Using fallback: Simple text extraction")
         return self._fallback_summary(text)
 
     def _fallback_summary(self, text: str) -> str:
@@ -162,67 +620,82 @@ class HuggingFaceClient:
             )
             # Returns: {"bug": 0.95, "feature": 0.03, "refactor": 0.02, ...}
         """
+        key = _cache_key("zero-shot", text, labels)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Truncate long text
             if len(text) > 512:
                 text = text[:512]
 
-            print("   Classifying with zero-shot model...")
+            logger.debug("Classifying with zero-shot model...")
 
             result = self.client.zero_shot_classification(
                 text, labels=labels, model="facebook/bart-large-mnli"
             )
 
-            print("   ✅ Classification complete")
-
-            # Handle different response formats
-            if isinstance(result, dict):
-                if "labels" in result and "scores" in result:
-                    return {
-                        label: score
-                        for label, score in zip(result["labels"], result["scores"])
-                    }
-            elif hasattr(result, "labels") and hasattr(result, "scores"):
-                return {
-                    label: score for label, score in zip(result.labels, result.scores)
-                }
-            elif isinstance(result, list) and len(result) > 0:
-                # Sometimes returns list of dicts
-                item = result[0]
-                if isinstance(item, dict) and "labels" in item and "scores" in item:
-                    return {
-                        label: score
-                        for label, score in zip(item["labels"], item["scores"])
-                    }
+            logger.debug("✅ Classification complete")
+
+            parsed = _parse_classification(result)
+            if parsed is not None:
+                self._cache_put(key, parsed)
+                return parsed
 
             # If we can't parse it, fall back
-            print(f"   ⚠️  Unexpected response format: {type(result)}")
+            logger.warning("⚠️  Unexpected response format: %s", type(result))
             raise ValueError("Unexpected response format")
 
         except Exception as e:
-            print(f"   ⚠️  Classification failed: {str(e)[:100]}")
-            print("   ℹ️  Using fallback: Keyword-based classification")
+            logger.warning("⚠️  Classification failed: %s", str(e)[:100])
+            logger.info("ℹ️  Using fallback: Keyword-based classification")
+            return self._fallback_classify(text, labels)
+
+    async def classify_async(self, text: str, labels: List[str]) -> Dict[str, float]:
+        """
+        Async version of classify() - awaits the AsyncInferenceClient so
+        the round-trip overlaps with the concurrent summarization call
+        """
+        key = _cache_key("zero-shot", text, labels)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Truncate long text
+            if len(text) > 512:
+                text = text[:512]
+
+            result = await self.aclient.zero_shot_classification(
+                text, labels=labels, model="facebook/bart-large-mnli"
+            )
+
+            parsed = _parse_classification(result)
+            if parsed is not None:
+                self._cache_put(key, parsed)
+                return parsed
+
+            logger.warning("⚠️  Unexpected response format: %s", type(result))
+            raise ValueError("Unexpected response format")
+
+        except Exception as e:
+            logger.warning("⚠️  Classification failed: %s", str(e)[:100])
+            logger.info("ℹ️  Using fallback: Keyword-based classification")
             return self._fallback_classify(text, labels)
 
     def _fallback_classify(self, text: str, labels: List[str]) -> Dict[str, float]:
         """
         Simple keyword-based classification fallback
         """
-        text_lower = text.lower()
-
-        # Simple keyword matching
+        # One compiled-regex scan per label (see _KW_RES) instead of a
+        # Python substring search per keyword. The patterns carry
+        # IGNORECASE, so no lowered copy of the text is allocated either.
         scores = {}
-        keywords = {
-            "bug": ["fix", "bug", "issue", "error", "crash", "broken"],
-            "feature": ["add", "new", "feature", "implement", "create"],
-            "refactor": ["refactor", "cleanup", "improve", "optimize", "reorganize"],
-            "docs": ["doc", "readme", "comment", "documentation"],
-        }
-
         for label in labels:
-            if label in keywords:
-                matches = sum(1 for kw in keywords[label] if kw in text_lower)
-                scores[label] = min(matches * 0.25, 0.9)  # Cap at 0.9
+            kw_re = _KW_RES.get(label)
+            if kw_re is not None:
+                scores[label] = min(len(kw_re.findall(text)) * 0.25, 0.9)
             else:
                 scores[label] = 0.1
 
@@ -248,32 +721,34 @@ class HuggingFaceClient:
         Returns:
             Conventional commit message
         """
-        # Map our classifications to conventional commit types
-        type_mapping = {
-            "bug": "fix",
-            "feature": "feat",
-            "refactor": "refactor",
-            "docs": "docs",
-        }
-
-        commit_type = type_mapping.get(pr_type, "chore")
+        commit_type = _TYPE_MAPPING.get(pr_type, "chore")
 
         # Simple template for now
         # TODO: Use a generative model for more sophisticated messages
         return f"{commit_type}: {pr_title.lower()}"
 
 
-# Singleton instance for reuse
-_client_instance = None
+# Singleton storage for get_hf_client. An explicit lock, not lru_cache:
+# lru_cache only keeps its cache structure coherent and may still run
+# the wrapped function more than once when threads race the first call.
+_client_instance: Optional[HuggingFaceClient] = None
+_client_lock = threading.Lock()
 
 
 def get_hf_client() -> HuggingFaceClient:
     """
     Get a singleton HuggingFace client instance
 
-    This avoids creating multiple clients and reuses connections.
+    Double-checked locking: the fast path is a single lock-free global
+    read, and the lock serializes only the first construction, so
+    concurrent first calls from Celery thread/gevent pools build exactly
+    one client. The instance (and its pooled sessions) is then shared by
+    every task in the process; the worker warms it at fork time in
+    tasks.py.
     """
     global _client_instance
     if _client_instance is None:
-        _client_instance = HuggingFaceClient()
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = HuggingFaceClient()
     return _client_instance
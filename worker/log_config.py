@@ -0,0 +1,49 @@
+"""
+Worker Logging Configuration
+
+The worker used to report progress with print() calls. print() holds the
+stdout lock and flushes on every newline, which serializes concurrent
+worker threads/processes on terminal I/O.
+
+This module routes log records through a queue instead:
+- the worker thread only enqueues the record (non-blocking, no I/O)
+- a background listener thread does the formatting and writing
+
+So the hot analysis path never waits on stdout.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_configured = False
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Install a QueueHandler -> QueueListener pipeline on the root logger
+
+    Safe to call more than once - only the first call takes effect.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
@@ -0,0 +1,140 @@
+"""
+Redis Stream Job Consumer
+
+The webhook server enqueues PR jobs with a single XADD to the
+"pr_pilot:jobs" stream (see backend/main.py) - much cheaper than a full
+Celery publish on the web hot path.
+
+This process is the other half: it reads the stream with XREADGROUP and
+hands each job to the Celery worker pool via analyze_pr.delay(). Entries
+are only XACK'd after a successful dispatch, so delivery stays
+at-least-once: the consumer keeps a stable name (hostname, or
+CONSUMER_NAME) across restarts and drains its own pending list at
+startup, so entries read-but-not-acked by a crashed run are re-dispatched
+by the next one.
+
+Run it alongside the Celery worker:
+  python -m worker.stream_consumer
+"""
+
+import logging
+import os
+import socket
+
+import orjson
+from dotenv import load_dotenv
+from redis import Redis
+from redis.exceptions import ResponseError
+
+from worker.log_config import configure_logging
+from worker.tasks import analyze_pr
+
+load_dotenv()
+configure_logging()
+
+logger = logging.getLogger(__name__)
+
+JOBS_STREAM = "pr_pilot:jobs"
+CONSUMER_GROUP = "pr_pilot_workers"
+
+# How many entries to pull per XREADGROUP, and how long to block waiting
+READ_COUNT = 32
+BLOCK_MS = 5000
+
+
+def _ensure_group(redis: Redis) -> None:
+    """Create the consumer group (idempotent - BUSYGROUP means it exists)"""
+    try:
+        redis.xgroup_create(JOBS_STREAM, CONSUMER_GROUP, id="0", mkstream=True)
+    except ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+
+def _dispatch(entry_id: bytes, fields: dict) -> None:
+    """Hand one stream entry to the Celery worker pool"""
+    repo = fields[b"repo"].decode()
+    pr_number = int(fields[b"pr"])
+    payload = orjson.loads(fields[b"payload"])
+
+    analyze_pr.delay(repo, pr_number, payload)
+    logger.info("📤 Dispatched %s#%s (entry %s)", repo, pr_number, entry_id.decode())
+
+
+def _handle(redis: Redis, messages) -> None:
+    """Dispatch a batch of stream messages, acking per the usual rules"""
+    for entry_id, fields in messages:
+        try:
+            _dispatch(entry_id, fields)
+        except (KeyError, ValueError):
+            # A malformed entry (missing field, bad JSON) would
+            # fail forever - log and ack it away instead of
+            # blocking the stream
+            logger.exception("❌ Bad job entry %s", entry_id)
+            redis.xack(JOBS_STREAM, CONSUMER_GROUP, entry_id)
+        except Exception:
+            # Transient dispatch failure (e.g. broker briefly
+            # unreachable): leave the entry pending so it gets
+            # re-claimed - delivery stays at-least-once
+            logger.exception(
+                "⚠️  Dispatch failed for %s - leaving pending", entry_id
+            )
+        else:
+            redis.xack(JOBS_STREAM, CONSUMER_GROUP, entry_id)
+
+
+def _drain_pending(redis: Redis, consumer_name: str) -> None:
+    """
+    Re-dispatch entries this consumer read but never acked
+
+    XREADGROUP with ">" only ever delivers brand-new entries, so
+    anything a crashed run left in the pending list would be orphaned
+    forever. Reading with an explicit id walks our own pending list
+    instead; the id advances past each batch so an entry that fails
+    again here doesn't loop (it stays pending for the next restart).
+    """
+    next_id = "0"
+    while True:
+        entries = redis.xreadgroup(
+            CONSUMER_GROUP,
+            consumer_name,
+            {JOBS_STREAM: next_id},
+            count=READ_COUNT,
+        )
+        messages = entries[0][1] if entries else []
+        if not messages:
+            return
+        logger.info("♻️  Re-dispatching %s pending entries", len(messages))
+        _handle(redis, messages)
+        next_id = messages[-1][0].decode()
+
+
+def main() -> None:
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    redis = Redis.from_url(redis_url)
+    _ensure_group(redis)
+
+    # A STABLE name - hostname, not hostname+pid - so a restarted
+    # consumer owns the same pending list and can drain what its
+    # predecessor left behind. Override with CONSUMER_NAME if several
+    # consumers share a host.
+    consumer_name = os.getenv("CONSUMER_NAME", socket.gethostname())
+    logger.info("👂 Consuming %s as %s", JOBS_STREAM, consumer_name)
+
+    _drain_pending(redis, consumer_name)
+
+    while True:
+        entries = redis.xreadgroup(
+            CONSUMER_GROUP,
+            consumer_name,
+            {JOBS_STREAM: ">"},
+            count=READ_COUNT,
+            block=BLOCK_MS,
+        )
+
+        for _stream, messages in entries or []:
+            _handle(redis, messages)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,23 +15,119 @@ Why Celery?
 - Won't block the webhook endpoint
 """
 
+import functools
+import logging
 import os
+import random
+import time
 
+import orjson
 from celery import Celery
+from celery.signals import worker_process_init
 from dotenv import load_dotenv
+from kombu import serialization
 
 from worker.analyzers.pr_analyzer import PRAnalyzer
 from worker.integrations.github_client import get_github_client
+from worker.integrations.huggingface_client import get_hf_client
+from worker.log_config import configure_logging
+
+logger = logging.getLogger("pr_pilot.tasks")
 
 # Load environment variables
 load_dotenv()
 
+# Route worker logs through a background listener thread (no stdout
+# lock contention on the analysis hot path)
+configure_logging()
+
+# Register the same orjson serializer the backend uses to enqueue tasks,
+# so payloads are decoded with the fast parser on this side too
+serialization.register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
+
 # Connect to Redis (our message queue)
 redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 celery_app = Celery("pr-pilot", broker=redis_url, backend=redis_url)
+celery_app.conf.update(
+    task_serializer="orjson",
+    result_serializer="orjson",
+    accept_content=["orjson", "json"],
+    # gzip the broker messages: analysis payloads compress well, and a
+    # retried task re-enqueues its arguments through Redis each time
+    task_compression="gzip",
+)
+
+
+def _retry_countdown(retries: int, exc: Exception) -> float:
+    """
+    Pick a retry delay that matches the failure, not a flat 60 s
+
+    Default is exponential backoff (5s, 10s, 20s... capped at 120s) plus
+    jitter, so a fleet of workers doesn't stampede Redis/HF/GitHub the
+    moment they recover. HTTP errors that tell us when to come back get
+    believed instead: a HuggingFace 503 carries estimated_time for the
+    model cold-load (usually <20s), and a GitHub rate limit carries the
+    X-RateLimit-Reset epoch. Both requests and httpx exceptions hang the
+    response off the exception the same way, so duck-typing covers both.
+    """
+    countdown = min(2**retries * 5, 120) + random.uniform(0, 5)
+
+    response = getattr(exc, "response", None)
+    if response is not None:
+        headers = getattr(response, "headers", None) or {}
+        status = getattr(response, "status_code", None)
+        try:
+            if status == 503:
+                # estimated_time arrives in the 503 JSON *body*, not as
+                # a header (same place HuggingFaceClient._note_cold
+                # reads it from)
+                countdown = float(
+                    response.json().get("estimated_time", countdown)
+                )
+            elif status in (403, 429) and "X-RateLimit-Reset" in headers:
+                countdown = max(
+                    0.0, float(headers["X-RateLimit-Reset"]) - time.time()
+                ) + random.uniform(0, 5)
+        except (AttributeError, TypeError, ValueError):
+            pass  # unparseable response - keep the backoff default
+
+    return countdown
+
+
+@functools.lru_cache(maxsize=1)
+def _get_analyzer() -> PRAnalyzer:
+    """
+    One PRAnalyzer per worker process
 
+    The analyzer pulls in both API clients (GitHub HTTP/2 pool, HF
+    sessions, Redis cache); rebuilding all of that on every task threw
+    away the warm connections each time.
+    """
+    return PRAnalyzer()
+
+
+@worker_process_init.connect
+def init_worker(**kwargs):
+    """
+    Warm the singleton clients when each prefork child starts
 
-@celery_app.task(bind=True, max_retries=3)
+    Building the analyzer and its HF client (HTTP backend registration,
+    session pools, Redis cache connection) costs tens of milliseconds -
+    pay it once at fork time instead of inside the first PR's analysis.
+    """
+    get_hf_client()
+    _get_analyzer()
+
+
+# acks_late: the message is acked after the task finishes, so a worker
+# that dies mid-analysis gets its PR redelivered instead of dropped
+@celery_app.task(bind=True, max_retries=3, acks_late=True, compression="gzip")
 def analyze_pr(self, repo: str, pr_number: int, payload: dict):
     """
     Main task that analyzes a pull request.
@@ -51,32 +147,34 @@ def analyze_pr(self, repo: str, pr_number: int, payload: dict):
         dict with analysis results
     """
     try:
-        print(f"\n🚀 Starting analysis for {repo}#{pr_number}")
+        logger.info("🚀 Starting analysis for %s#%s", repo, pr_number)
 
-        # Initialize analyzer
-        analyzer = PRAnalyzer()
+        # Per-process cached backends - no cold start on every task
+        analyzer = _get_analyzer()
         github = get_github_client()
 
         # Step 1-6: Comprehensive analysis
         analysis = analyzer.analyze(repo, pr_number)
 
         if not analysis.get("success"):
-            print(f"❌ Analysis failed: {analysis.get('error')}")
+            logger.error("❌ Analysis failed: %s", analysis.get("error"))
             return {"status": "failed", "error": analysis.get("error")}
 
         # Step 7: Format comment
-        print("📝 Formatting GitHub comment...")
+        logger.info("📝 Formatting GitHub comment...")
         comment = analyzer.format_comment(analysis)
 
         # Step 8: Post to GitHub
-        print("📤 Posting comment to GitHub...")
+        logger.info("📤 Posting comment to GitHub...")
         success = github.post_comment(repo, pr_number, comment)
 
         if success:
-            print(f"✅ Successfully analyzed and commented on {repo}#{pr_number}\n")
+            logger.info("✅ Successfully analyzed and commented on %s#%s", repo, pr_number)
             return {"status": "success", "analysis": analysis, "commented": True}
         else:
-            print(f"⚠️  Analysis succeeded but comment failed for {repo}#{pr_number}\n")
+            logger.warning(
+                "⚠️  Analysis succeeded but comment failed for %s#%s", repo, pr_number
+            )
             return {
                 "status": "partial_success",
                 "analysis": analysis,
@@ -84,13 +182,17 @@ def analyze_pr(self, repo: str, pr_number: int, payload: dict):
             }
 
     except Exception as e:
-        print(f"❌ Task failed with error: {e}")
+        logger.error("❌ Task failed with error: %s", e)
 
         # Retry logic
         if self.request.retries < self.max_retries:
-            print(
-                f"   Retrying... (attempt {self.request.retries + 1}/{self.max_retries})"
+            countdown = _retry_countdown(self.request.retries, e)
+            logger.warning(
+                "Retrying in %.0fs... (attempt %s/%s)",
+                countdown,
+                self.request.retries + 1,
+                self.max_retries,
             )
-            raise self.retry(exc=e, countdown=60)  # Retry after 60 seconds
+            raise self.retry(exc=e, countdown=countdown)
 
         return {"status": "error", "error": str(e)}